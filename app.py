@@ -3,12 +3,13 @@ Minimal Flask App - Guaranteed to Work in Vercel
 """
 
 from flask import Flask, render_template
+from web_utils import STATIC_PAGE_HEADERS, static_page
 
 app = Flask(__name__)
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return static_page('index.html'), STATIC_PAGE_HEADERS
 
 @app.route('/dashboard')
 def dashboard():
@@ -16,11 +17,11 @@ def dashboard():
 
 @app.route('/about')
 def about():
-    return render_template('about.html')
+    return static_page('about.html'), STATIC_PAGE_HEADERS
 
 @app.route('/documentation')
 def documentation():
-    return render_template('documentation.html')
+    return static_page('documentation.html'), STATIC_PAGE_HEADERS
 
 def handler(event, context):
     return app(event, context)
@@ -3,17 +3,21 @@ Business Analytics Dashboard - Web Application
 Flask-based web application for interactive business analytics
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, Response, render_template, request, send_file
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
 import io
-import base64
+try:
+    import pybase64 as base64  # SIMD encoder, same API as the stdlib module
+except ImportError:
+    import base64
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from config import CHART_DPI
+from web_utils import STATIC_PAGE_HEADERS, dumps_json, ojson, static_page
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -21,44 +25,34 @@ warnings.filterwarnings('ignore')
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'business-analytics-dashboard-2025'
 
-# Set style for better looking charts
-try:
-    plt.style.use('seaborn-v0_8')
-except:
-    try:
-        plt.style.use('seaborn')
-    except:
-        plt.style.use('default')
-sns.set_palette("husl")
-
 # Load and prepare the data
 def load_data(filepath='DevicesData.xlsx'):
-    """Load and clean the stock data"""
+    """Load and clean the stock data
+
+    The parsed frame is cached per (path, mtime), so repeated requests reuse it
+    until the file changes on disk. Callers must treat it as read-only; derived
+    series come from compute_features().
+    """
     try:
         # Check if file exists
         if not os.path.exists(filepath):
             print(f"Data file {filepath} not found, using sample data")
             return create_sample_data()
-        
-        df = pd.read_excel(filepath)
-        # Split the single column into multiple columns
-        df_split = df.iloc[:, 0].str.split(',', expand=True)
-        df_split.columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-
-        # Convert data types
-        df_split['Date'] = pd.to_datetime(df_split['Date'])
-        for col in ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']:
-            df_split[col] = pd.to_numeric(df_split[col], errors='coerce')
-
-        # Set Date as index
-        df_split.set_index('Date', inplace=True)
-        return df_split
+
+        return _read_data(filepath, os.path.getmtime(filepath))
     except Exception as e:
         print(f"Error loading data: {e}")
         return create_sample_data()
 
+@lru_cache(maxsize=4)
+def _read_data(filepath, mtime):
+    """Parse the Excel file; ``mtime`` is only part of the cache key"""
+    from utils import read_packed_workbook
+    return read_packed_workbook(filepath)
+
+@lru_cache(maxsize=1)
 def create_sample_data():
-    """Create sample data for demonstration"""
+    """Create sample data for demonstration (generated once per process)"""
     dates = pd.date_range('2020-01-01', '2023-12-31', freq='D')
     np.random.seed(42)
     
@@ -79,6 +73,41 @@ def create_sample_data():
     return df
 
 # Analytics functions
+# utils (and with it numba) is imported on first use, so cold starts and the
+# static pages don't pay for it; the kernels compile on the first data load.
+def compute_features(df):
+    """Derive the return and indicator arrays shared by analytics and charts
+
+    Computed once per version of the data file (see _prepared_data) so the
+    cached DataFrame is never written to.
+    """
+    if df is None:
+        return None
+    from utils import sma, calculate_rsi, cumulative_return
+    
+    close = df['Close'].to_numpy(dtype=np.float64)
+    # Carry the last close over blank ones, as pct_change's deprecated default did
+    filled = df['Close'].ffill().to_numpy(dtype=np.float64)
+    daily_return = np.empty_like(close)
+    daily_return[0] = np.nan
+    daily_return[1:] = filled[1:] / filled[:-1] - 1
+    
+    # Drawdown from the running peak, measured from the first return onwards
+    cumulative = cumulative_return(daily_return)
+    drawdown = np.empty_like(close)
+    drawdown[0] = np.nan
+    drawdown[1:] = cumulative[1:] / np.maximum.accumulate(cumulative[1:]) - 1
+    
+    return {
+        'close': close,
+        'daily_return': daily_return,
+        'cumulative_return': cumulative,
+        'drawdown': drawdown,
+        'sma_20': sma(close, 20),
+        'sma_50': sma(close, 50),
+        'rsi': calculate_rsi(close)
+    }
+
 def descriptive_analytics(df):
     """Basic descriptive statistics and data overview"""
     if df is None:
@@ -93,49 +122,32 @@ def descriptive_analytics(df):
         'current_price': f"${df['Close'].iloc[-1]:.2f}"
     }
 
-def performance_analytics(df):
+def performance_analytics(df, features):
     """Returns and performance metrics"""
     if df is None:
         return {}
     
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['Cumulative_Return'] = (1 + df['Daily_Return']).cumprod()
-    
-    total_return = df['Cumulative_Return'].iloc[-1] - 1
-    annual_return = (df['Cumulative_Return'].iloc[-1] ** (252/len(df))) - 1
-    volatility = df['Daily_Return'].std() * np.sqrt(252)
+    cumulative = features['cumulative_return']
+    total_return = cumulative[-1] - 1
+    annual_return = (cumulative[-1] ** (252/len(df))) - 1
+    volatility = np.nanstd(features['daily_return'], ddof=1) * np.sqrt(252)
     
     return {
         'total_return': f"{total_return:.2%}",
         'annualized_return': f"{annual_return:.2%}",
         'annualized_volatility': f"{volatility:.2%}",
-        'current_volatility': f"{df['Daily_Return'].std() * np.sqrt(252):.2%}"
+        'current_volatility': f"{volatility:.2%}"
     }
 
-def technical_analytics(df):
+def technical_analytics(df, features):
     """Technical indicators"""
     if df is None:
         return {}
     
-    # Simple Moving Averages
-    df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    df['SMA_50'] = df['Close'].rolling(window=50).mean()
-    
-    # RSI
-    def calculate_rsi(data, window=14):
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-
-    df['RSI'] = calculate_rsi(df['Close'])
-    
-    current_price = df['Close'].iloc[-1]
-    current_sma_20 = df['SMA_20'].iloc[-1]
-    current_sma_50 = df['SMA_50'].iloc[-1]
-    current_rsi = df['RSI'].iloc[-1]
+    current_price = features['close'][-1]
+    current_sma_20 = features['sma_20'][-1]
+    current_sma_50 = features['sma_50'][-1]
+    current_rsi = features['rsi'][-1]
     
     signal = "BULLISH" if current_price > current_sma_50 else "BEARISH"
     
@@ -148,26 +160,24 @@ def technical_analytics(df):
         'signal_color': 'green' if signal == 'BULLISH' else 'red'
     }
 
-def risk_analytics(df):
+def risk_analytics(df, features):
     """Risk metrics and VaR"""
     if df is None:
         return {}
+    from utils import quantile
     
-    returns = df['Close'].pct_change().dropna()
+    returns = features['daily_return'][1:]
     
     # Value at Risk (95% confidence)
-    var_95 = np.percentile(returns, 5)
+    var_95 = quantile(returns, 0.05)
     
     # Maximum Drawdown
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    max_drawdown = drawdown.min()
+    max_drawdown = features['drawdown'][1:].min()
     
     # Sharpe Ratio (assuming 2% risk-free rate)
     risk_free_rate = 0.02
     excess_returns = returns - risk_free_rate/252
-    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / returns.std()
+    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / returns.std(ddof=1)
     
     return {
         'var_95': f"{var_95:.2%}",
@@ -177,145 +187,257 @@ def risk_analytics(df):
     }
 
 # Chart generation functions
-def create_price_chart(df):
+# Charts use Figure/FigureCanvasAgg directly rather than pyplot, whose global
+# state is not thread-safe, so the dashboard can render them concurrently.
+# matplotlib is imported on first render so serving pages and JSON (and cold
+# starts) never load it.
+MAX_CHART_POINTS = 2000  # more points than this add draw time, not detail
+
+def _decimate(x, *ys, max_points=MAX_CHART_POINTS):
+    """Thin x and the matching y arrays to at most ``max_points`` samples"""
+    if len(x) <= max_points:
+        return (x,) + ys
+    step = -(-len(x) // max_points)
+    return (x[::step],) + tuple(y[::step] for y in ys)
+
+_STYLE_SET = False
+_STYLE_LOCK = threading.Lock()
+
+def _apply_chart_style():
+    """Set style for better looking charts, once, on the first render
+
+    Deferred from import time so requests that never draw a chart don't pay
+    for loading seaborn and the style sheets.
+    """
+    global _STYLE_SET
+    with _STYLE_LOCK:
+        if _STYLE_SET:
+            return
+        from matplotlib import style as mpl_style
+        import seaborn as sns
+        try:
+            mpl_style.use('seaborn-v0_8')
+        except:
+            try:
+                mpl_style.use('seaborn')
+            except:
+                mpl_style.use('default')
+        sns.set_palette("husl")
+        _STYLE_SET = True
+
+_FIGURES = threading.local()
+
+def _new_figure(figsize):
+    """Return this thread's Agg-backed figure, cleared and resized
+
+    Each worker thread keeps one Figure and canvas and reuses them across
+    charts instead of allocating a new pair per render.
+    """
+    fig = getattr(_FIGURES, 'fig', None)
+    if fig is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
+        _apply_chart_style()
+        fig = _FIGURES.fig = Figure()
+        FigureCanvasAgg(fig)
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig
+
+def _encode_figure(fig):
+    """Render a figure to a base64 JPEG string"""
+    img = io.BytesIO()
+    fig.savefig(img, format='jpeg', dpi=CHART_DPI, bbox_inches='tight', pil_kwargs={'quality': 85})
+    # getbuffer() is a zero-copy view; getvalue() would copy the whole image
+    return base64.b64encode(img.getbuffer()).decode('ascii')
+
+def create_price_chart(df, features):
     """Create price history chart"""
     if df is None:
         return None
     
-    plt.figure(figsize=(12, 6))
-    plt.plot(df.index, df['Close'], label='Close Price', linewidth=2, color='blue')
-    plt.plot(df.index, df['Close'].rolling(window=50).mean(), label='50-day SMA', linewidth=2, color='red')
-    plt.title('Stock Price History with 50-day SMA', fontsize=16, fontweight='bold')
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Price ($)', fontsize=12)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    # Convert to base64 string
-    img = io.BytesIO()
-    plt.savefig(img, format='png', dpi=300, bbox_inches='tight')
+    dates, close, sma_50 = _decimate(df.index, features['close'], features['sma_50'])
+    
+    fig = _new_figure((12, 6))
+    ax = fig.add_subplot()
+    ax.plot(dates, close, label='Close Price', linewidth=2, color='blue')
+    ax.plot(dates, sma_50, label='50-day SMA', linewidth=2, color='red')
+    ax.set_title('Stock Price History with 50-day SMA', fontsize=16, fontweight='bold')
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel('Price ($)', fontsize=12)
+    ax.legend(fontsize=10)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    
+    return _encode_figure(fig)
 
-def create_volume_chart(df):
+def create_volume_chart(df, features):
     """Create volume chart"""
     if df is None:
         return None
     
-    plt.figure(figsize=(12, 4))
-    plt.bar(df.index, df['Volume'], color='orange', alpha=0.7)
-    plt.title('Trading Volume History', fontsize=16, fontweight='bold')
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Volume', fontsize=12)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    # Convert to base64 string
-    img = io.BytesIO()
-    plt.savefig(img, format='png', dpi=300, bbox_inches='tight')
-    img.seek(0)
-    plot_url = base64.b64encode(img.getvalue()).decode('utf8')
-    plt.close()
-    return plot_url
+    fig = _new_figure((12, 4))
+    ax = fig.add_subplot()
+    if len(df) > MAX_CHART_POINTS:
+        # Decimating bars would alias; aggregate to weekly totals instead
+        weekly = df['Volume'].resample('W').sum()
+        ax.bar(weekly.index, weekly, width=5, color='orange', alpha=0.7)
+        ylabel = 'Weekly Volume'
+    else:
+        ax.bar(df.index, df['Volume'], color='orange', alpha=0.7)
+        ylabel = 'Volume'
+    ax.set_title('Trading Volume History', fontsize=16, fontweight='bold')
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    
+    return _encode_figure(fig)
 
-def create_returns_chart(df):
+def create_returns_chart(df, features):
     """Create returns distribution chart"""
     if df is None:
         return None
     
-    df['Daily_Return'] = df['Close'].pct_change()
-    returns = df['Daily_Return'].dropna()
-    
-    plt.figure(figsize=(12, 6))
-    plt.subplot(1, 2, 1)
-    plt.hist(returns, bins=50, alpha=0.7, color='blue', edgecolor='black')
-    plt.title('Daily Returns Distribution', fontsize=14, fontweight='bold')
-    plt.xlabel('Daily Returns', fontsize=12)
-    plt.ylabel('Frequency', fontsize=12)
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(1, 2, 2)
-    df['Cumulative_Return'] = (1 + returns).cumprod()
-    plt.plot(df.index, df['Cumulative_Return'], color='green', linewidth=2)
-    plt.title('Cumulative Returns', fontsize=14, fontweight='bold')
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Cumulative Return', fontsize=12)
-    plt.grid(True, alpha=0.3)
-    plt.gca().yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: '{:.1%}'.format(y)))
-    
-    plt.tight_layout()
-    
-    # Convert to base64 string
-    img = io.BytesIO()
-    plt.savefig(img, format='png', dpi=300, bbox_inches='tight')
-    img.seek(0)
-    plot_url = base64.b64encode(img.getvalue()).decode('utf8')
-    plt.close()
-    return plot_url
+    returns = features['daily_return'][1:]
+    
+    fig = _new_figure((12, 6))
+    ax = fig.add_subplot(1, 2, 1)
+    ax.hist(returns, bins=50, alpha=0.7, color='blue', edgecolor='black')
+    ax.set_title('Daily Returns Distribution', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Daily Returns', fontsize=12)
+    ax.set_ylabel('Frequency', fontsize=12)
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(1, 2, 2)
+    ax.plot(df.index[1:], features['cumulative_return'][1:], color='green', linewidth=2)
+    ax.set_title('Cumulative Returns', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel('Cumulative Return', fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.yaxis.set_major_formatter(lambda y, _: '{:.1%}'.format(y))
+    
+    fig.tight_layout()
+    
+    return _encode_figure(fig)
 
-def create_risk_chart(df):
+def create_risk_chart(df, features):
     """Create risk analysis chart"""
     if df is None:
         return None
     
-    df['Daily_Return'] = df['Close'].pct_change()
-    returns = df['Daily_Return'].dropna()
-    
-    # Calculate drawdown
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    
-    plt.figure(figsize=(12, 6))
-    plt.fill_between(drawdown.index, drawdown, 0, alpha=0.3, color='red', label='Drawdown')
-    plt.plot(drawdown.index, drawdown, color='darkred', linewidth=2)
-    plt.title('Maximum Drawdown Analysis', fontsize=16, fontweight='bold')
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Drawdown', fontsize=12)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.gca().yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: '{:.1%}'.format(y)))
-    plt.tight_layout()
-    
-    # Convert to base64 string
-    img = io.BytesIO()
-    plt.savefig(img, format='png', dpi=300, bbox_inches='tight')
-    img.seek(0)
-    plot_url = base64.b64encode(img.getvalue()).decode('utf8')
-    plt.close()
-    return plot_url
+    dates = df.index[1:]
+    drawdown = features['drawdown'][1:]
+    
+    fig = _new_figure((12, 6))
+    ax = fig.add_subplot()
+    ax.fill_between(dates, drawdown, 0, alpha=0.3, color='red', label='Drawdown')
+    ax.plot(dates, drawdown, color='darkred', linewidth=2)
+    ax.set_title('Maximum Drawdown Analysis', fontsize=16, fontweight='bold')
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel('Drawdown', fontsize=12)
+    ax.legend(fontsize=10)
+    ax.grid(True, alpha=0.3)
+    ax.yaxis.set_major_formatter(lambda y, _: '{:.1%}'.format(y))
+    fig.tight_layout()
+    
+    return _encode_figure(fig)
+
+CHART_FUNCTIONS = {
+    'price': create_price_chart,
+    'volume': create_volume_chart,
+    'returns': create_returns_chart,
+    'risk': create_risk_chart
+}
+
+def _data_mtime(filepath):
+    """Modification time used to key the caches (None when the file is missing)"""
+    return os.path.getmtime(filepath) if os.path.exists(filepath) else None
+
+def get_analytics(filepath='DevicesData.xlsx'):
+    """Return (analytics dict, JSON body), recomputed only when the data file changes"""
+    return _compute_analytics(filepath, _data_mtime(filepath))
+
+@lru_cache(maxsize=4)
+def _prepared_data(filepath, mtime):
+    """Load the data and derive its features once; ``mtime`` is only part of the cache key
+
+    The analytics and every chart read the same arrays, so none of them
+    may modify them.
+    """
+    df = load_data(filepath)
+    if df is None:
+        return None, None
+    return df, compute_features(df)
+
+@lru_cache(maxsize=4)
+def _compute_analytics(filepath, mtime):
+    """Run all analytics once; ``mtime`` is only part of the cache key"""
+    df, features = _prepared_data(filepath, mtime)
+    if df is None:
+        return None, None
+    
+    analytics = {
+        'descriptive': descriptive_analytics(df),
+        'performance': performance_analytics(df, features),
+        'technical': technical_analytics(df, features),
+        'risk': risk_analytics(df, features)
+    }
+    return analytics, dumps_json(analytics)
+
+def render_chart(chart_type, filepath='DevicesData.xlsx'):
+    """Return a base64 chart image, re-rendering only when the data file changes"""
+    return _render_chart(chart_type, filepath, _data_mtime(filepath))
+
+@lru_cache(maxsize=16)
+def _render_chart(chart_type, filepath, mtime):
+    """Render one chart; ``mtime`` is only part of the cache key"""
+    df, features = _prepared_data(filepath, mtime)
+    if df is None:
+        return None
+    return CHART_FUNCTIONS[chart_type](df, features)
+
+_CHART_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def _chart_executor():
+    """Return the process-wide chart pool, created on the first dashboard request
+
+    Its threads outlive each request, so their thread-local figures (see
+    _new_figure) are reused rather than rebuilt every time.
+    """
+    global _CHART_EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _CHART_EXECUTOR is None:
+            _CHART_EXECUTOR = ThreadPoolExecutor(max_workers=len(CHART_FUNCTIONS),
+                                                 thread_name_prefix='chart')
+        return _CHART_EXECUTOR
 
 # Routes
 @app.route('/')
 def index():
     """Home page"""
-    return render_template('index.html')
+    return static_page('index.html'), STATIC_PAGE_HEADERS
 
 @app.route('/dashboard')
 def dashboard():
     """Main dashboard page"""
-    # Load data
-    df = load_data()
+    # Run analytics (cached until the data file changes)
+    analytics, _ = get_analytics()
     
-    if df is None:
+    if analytics is None:
         return render_template('error.html', message="Data file not found or corrupted")
     
-    # Run analytics
-    descriptive = descriptive_analytics(df)
-    performance = performance_analytics(df)
-    technical = technical_analytics(df)
-    risk = risk_analytics(df)
-    
-    # Generate charts
-    price_chart = create_price_chart(df)
-    volume_chart = create_volume_chart(df)
-    returns_chart = create_returns_chart(df)
-    risk_chart = create_risk_chart(df)
+    # Generate charts in parallel (cached until the data file changes)
+    price_chart, volume_chart, returns_chart, risk_chart = _chart_executor().map(
+        render_chart, ['price', 'volume', 'returns', 'risk'])
     
     return render_template('dashboard.html', 
-                         descriptive=descriptive,
-                         performance=performance,
-                         technical=technical,
-                         risk=risk,
+                         descriptive=analytics['descriptive'],
+                         performance=analytics['performance'],
+                         technical=analytics['technical'],
+                         risk=analytics['risk'],
                          price_chart=price_chart,
                          volume_chart=volume_chart,
                          returns_chart=returns_chart,
@@ -324,50 +446,37 @@ def dashboard():
 @app.route('/api/analytics')
 def api_analytics():
     """API endpoint for analytics data"""
-    df = load_data()
+    _, body = get_analytics()
     
-    if df is None:
-        return jsonify({'error': 'Data not found'}), 404
+    if body is None:
+        return ojson({'error': 'Data not found'}, 404)
     
-    # Return all analytics as JSON
-    return jsonify({
-        'descriptive': descriptive_analytics(df),
-        'performance': performance_analytics(df),
-        'technical': technical_analytics(df),
-        'risk': risk_analytics(df)
-    })
+    # Serve the pre-serialized JSON instead of re-encoding per request
+    return Response(body, mimetype='application/json')
 
 @app.route('/api/chart/<chart_type>')
 def api_chart(chart_type):
     """API endpoint for charts"""
-    df = load_data()
-    
-    if df is None:
-        return jsonify({'error': 'Data not found'}), 404
+    if chart_type not in CHART_FUNCTIONS:
+        return ojson({'error': 'Invalid chart type'}, 400)
     
     # Generate requested chart
-    if chart_type == 'price':
-        chart_url = create_price_chart(df)
-    elif chart_type == 'volume':
-        chart_url = create_volume_chart(df)
-    elif chart_type == 'returns':
-        chart_url = create_returns_chart(df)
-    elif chart_type == 'risk':
-        chart_url = create_risk_chart(df)
-    else:
-        return jsonify({'error': 'Invalid chart type'}), 400
+    chart_url = render_chart(chart_type)
+    
+    if chart_url is None:
+        return ojson({'error': 'Data not found'}, 404)
     
-    return jsonify({'chart_url': chart_url})
+    return ojson({'chart_url': chart_url})
 
 @app.route('/about')
 def about():
     """About page"""
-    return render_template('about.html')
+    return static_page('about.html'), STATIC_PAGE_HEADERS
 
 @app.route('/documentation')
 def documentation():
     """Documentation page"""
-    return render_template('documentation.html')
+    return static_page('documentation.html'), STATIC_PAGE_HEADERS
 
 # Error handlers
 @app.errorhandler(404)
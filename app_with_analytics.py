@@ -3,44 +3,50 @@ Simple Business Analytics Dashboard - Vercel Compatible
 Minimal Flask app that works reliably in serverless environment
 """
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template
 import pandas as pd
 import numpy as np
 import os
 from datetime import datetime
+from functools import lru_cache
+from web_utils import STATIC_PAGE_HEADERS, ojson, static_page
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'business-analytics-dashboard-2025'
 
 # Sample data generator
+@lru_cache(maxsize=1)
 def create_sample_data():
-    """Create sample data for demonstration"""
+    """Create sample data for demonstration
+
+    Built on first use rather than at import, and cached afterwards.
+    """
     dates = pd.date_range('2020-01-01', '2023-12-31', freq='D')
-    np.random.seed(42)
+    n = len(dates)
+    rng = np.random.default_rng(42)
     
     # Generate realistic stock-like data
-    price = 100 + np.cumsum(np.random.randn(len(dates)) * 0.02)
-    volume = np.random.randint(1000000, 5000000, len(dates))
+    price = 100 + np.cumsum(rng.standard_normal(n) * 0.02)
+    volume = rng.integers(1_000_000, 5_000_000, n, dtype=np.int32)
     
     data = {
-        'Open': price * (1 + np.random.randn(len(dates)) * 0.01),
-        'High': price * (1 + np.abs(np.random.randn(len(dates))) * 0.02),
-        'Low': price * (1 - np.abs(np.random.randn(len(dates))) * 0.02),
+        'Open': price * (1 + rng.standard_normal(n) * 0.01),
+        'High': price * (1 + np.abs(rng.standard_normal(n)) * 0.02),
+        'Low': price * (1 - np.abs(rng.standard_normal(n)) * 0.02),
         'Close': price,
         'Adj Close': price,
         'Volume': volume
     }
     
     df = pd.DataFrame(data, index=dates)
-    return df
-
-# Load data (always use sample data for reliability)
-df = create_sample_data()
+    return df.astype({col: np.float32 for col in ['Open', 'High', 'Low', 'Close', 'Adj Close']})
 
 # Basic analytics
 def get_basic_analytics():
     """Get basic analytics without charts"""
+    # Always use sample data for reliability
+    df = create_sample_data()
     if df is None or len(df) == 0:
         return {}
     
@@ -58,7 +64,7 @@ def get_basic_analytics():
 @app.route('/')
 def index():
     """Home page"""
-    return render_template('index.html')
+    return static_page('index.html'), STATIC_PAGE_HEADERS
 
 @app.route('/dashboard')
 def dashboard():
@@ -69,17 +75,17 @@ def dashboard():
 @app.route('/about')
 def about():
     """About page"""
-    return render_template('about.html')
+    return static_page('about.html'), STATIC_PAGE_HEADERS
 
 @app.route('/documentation')
 def documentation():
     """Documentation page"""
-    return render_template('documentation.html')
+    return static_page('documentation.html'), STATIC_PAGE_HEADERS
 
 @app.route('/api/analytics')
 def api_analytics():
     """API endpoint for analytics data"""
-    return jsonify(get_basic_analytics())
+    return ojson(get_basic_analytics())
 
 # Error handlers
 @app.errorhandler(404)
@@ -1,48 +1,143 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from dataclasses import dataclass
 from datetime import datetime
+from utils import njit, cached_frame, read_packed_workbook, safe_ratio, sma, calculate_rsi, quantile
 import warnings
 warnings.filterwarnings('ignore')
 
 # Load and prepare the data
 def load_data(filepath):
-    """Load and clean the stock data"""
-    df = pd.read_excel(filepath)
-    # Split the single column into multiple columns
-    df_split = df.iloc[:, 0].str.split(',', expand=True)
-    df_split.columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+    """Load and clean the stock data
 
-    # Convert data types
-    df_split['Date'] = pd.to_datetime(df_split['Date'])
-    for col in ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']:
-        df_split[col] = pd.to_numeric(df_split[col], errors='coerce')
+    With ENABLE_CACHING on, the parsed frame is kept in a parquet file next to
+    the workbook and reused for as long as it is newer than the workbook.
+    """
+    return cached_frame(filepath, '.parquet', _read_workbook)
 
-    # Set Date as index
-    df_split.set_index('Date', inplace=True)
-    return df_split
+def _read_workbook(filepath):
+    """Parse the CSV-packed workbook"""
+    return read_packed_workbook(filepath, volume_dtype=np.int32)
+
+# Shared inputs
+@dataclass
+class Ctx:
+    """Column arrays shared by every analytic, derived once in main()
+
+    ``ret`` holds the n-1 daily returns aligned with ``index[1:]``; the SMAs
+    are NaN until their window fills. ``month``/``year`` are the calendar
+    labels of each row, decoded from the index once.
+    """
+    index: pd.DatetimeIndex
+    month: np.ndarray
+    year: np.ndarray
+    close: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    volume: np.ndarray
+    ret: np.ndarray
+    sma20: np.ndarray
+    sma50: np.ndarray
+    sma200: np.ndarray
+
+def build_context(df):
+    """Extract the shared arrays and compute returns and SMAs a single time"""
+    close = df['Close'].to_numpy(dtype=np.float64)
+    # Carry the last close over blank ones, as pct_change's deprecated default did
+    filled = df['Close'].ffill().to_numpy(dtype=np.float64)
+    return Ctx(
+        index=df.index,
+        month=df.index.month.to_numpy().astype(np.int8),
+        year=df.index.year.to_numpy().astype(np.int16),
+        close=close,
+        high=df['High'].to_numpy(),
+        low=df['Low'].to_numpy(),
+        volume=df['Volume'].to_numpy(),
+        ret=np.diff(filled) / filled[:-1],
+        sma20=sma(close, 20),
+        sma50=sma(close, 50),
+        sma200=sma(close, 200)
+    )
+
+# Indicator kernels
+@njit(cache=True)
+def _backtest_kernel(signal, ret):
+    """Compound a +1/-1 position series and buy & hold side by side in one pass
+
+    Each day trades on the previous day's signal.
+    """
+    n = signal.shape[0]
+    strategy = np.empty(n)
+    buy_hold = np.empty(n)
+    strategy[0] = 1.0
+    buy_hold[0] = 1.0
+    for i in range(1, n):
+        r = ret[i-1]
+        strategy[i] = strategy[i-1] * (1 + signal[i-1] * r)
+        buy_hold[i] = buy_hold[i-1] * (1 + r)
+    return strategy, buy_hold
+
+@njit(cache=True)
+def _volume_sentiment_kernel(volume, ret, threshold):
+    """One pass over the return days: mean return on days with volume above
+    ``threshold`` and total volume on up and down days"""
+    high_sum = 0.0
+    high_count = 0
+    up_volume = 0.0
+    down_volume = 0.0
+    for i in range(ret.shape[0]):
+        v = volume[i + 1]
+        r = ret[i]
+        if v > threshold and r == r:
+            high_sum += r
+            high_count += 1
+        if r > 0 and v == v:
+            up_volume += v
+        elif r < 0 and v == v:
+            down_volume += v
+    avg_high = high_sum / high_count if high_count > 0 else np.nan
+    return avg_high, up_volume, down_volume
+
+def corr(x, y):
+    """Pearson correlation from three dot products, as Series.corr
+
+    Pairs where either side is NaN are skipped.
+    """
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    dx = x - x.mean()
+    dy = y - y.mean()
+    return float(dx @ dy / np.sqrt((dx @ dx) * (dy @ dy)))
+
+def autocorr1(a):
+    """Lag-1 autocorrelation of an array, as Series.autocorr(lag=1)
+
+    Correlates a[:-1] with a[1:], skipping pairs where either side is NaN.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    return corr(a[:-1], a[1:])
 
 # 1. DESCRIPTIVE ANALYTICS
-def descriptive_analytics(df):
+def descriptive_analytics(ctx):
     """Basic descriptive statistics and data overview"""
     print("=== 1. DESCRIPTIVE ANALYTICS ===")
-    print(f"Data period: {df.index.min().strftime('%Y-%m-%d')} to {df.index.max().strftime('%Y-%m-%d')}")
-    print(f"Total trading days: {len(df):,}")
-    print(f"Average daily volume: {df['Volume'].mean():,.0f}")
-    print(f"Price range: ${df['Low'].min():.2f} - ${df['High'].max():.2f}")
-    print(f"Average closing price: ${df['Close'].mean():.2f}")
+    print(f"Data period: {ctx.index.min().strftime('%Y-%m-%d')} to {ctx.index.max().strftime('%Y-%m-%d')}")
+    print(f"Total trading days: {len(ctx.close):,}")
+    print(f"Average daily volume: {np.nanmean(ctx.volume):,.0f}")
+    print(f"Price range: ${np.nanmin(ctx.low):.2f} - ${np.nanmax(ctx.high):.2f}")
+    print(f"Average closing price: ${np.nanmean(ctx.close):.2f}")
     print()
 
 # 2. PERFORMANCE ANALYTICS
-def performance_analytics(df):
+def performance_analytics(ctx):
     """Returns and performance metrics"""
     print("=== 2. PERFORMANCE ANALYTICS ===")
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['Cumulative_Return'] = (1 + df['Daily_Return']).cumprod()
+    cumulative_return = np.prod(1 + ctx.ret)
     
-    total_return = df['Cumulative_Return'].iloc[-1] - 1
-    annual_return = (df['Cumulative_Return'].iloc[-1] ** (252/len(df))) - 1
-    volatility = df['Daily_Return'].std() * np.sqrt(252)
+    total_return = cumulative_return - 1
+    annual_return = (cumulative_return ** (252/len(ctx.close))) - 1
+    volatility = ctx.ret.std(ddof=1) * np.sqrt(252)
     
     print(f"Total return: {total_return:.2%}")
     print(f"Annualized return: {annual_return:.2%}")
@@ -50,27 +145,16 @@ def performance_analytics(df):
     print()
 
 # 3. TECHNICAL ANALYSIS
-def technical_analysis(df):
+def technical_analysis(ctx):
     """Technical indicators"""
     print("=== 3. TECHNICAL ANALYTICS ===")
     
-    # Simple Moving Average
-    df['SMA_50'] = df['Close'].rolling(window=50).mean()
-    
     # RSI
-    def calculate_rsi(data, window=14):
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-    
-    df['RSI'] = calculate_rsi(df['Close'])
+    rsi = calculate_rsi(ctx.close)
     
-    current_price = df['Close'].iloc[-1]
-    current_sma = df['SMA_50'].iloc[-1]
-    current_rsi = df['RSI'].iloc[-1]
+    current_price = ctx.close[-1]
+    current_sma = ctx.sma50[-1]
+    current_rsi = rsi[-1]
     
     print(f"Current price: ${current_price:.2f}")
     print(f"50-day SMA: ${current_sma:.2f}")
@@ -83,25 +167,25 @@ def technical_analysis(df):
     print()
 
 # 4. RISK ANALYTICS
-def risk_analytics(df):
+def risk_analytics(ctx):
     """Risk metrics and VaR"""
     print("=== 4. RISK ANALYTICS ===")
     
-    returns = df['Daily_Return'].dropna()
+    returns = ctx.ret
     
     # Value at Risk (95% confidence)
-    var_95 = np.percentile(returns, 5)
+    var_95 = quantile(returns, 0.05)
     
     # Maximum Drawdown
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
+    cumulative = np.cumprod(1 + returns)
+    running_max = np.maximum.accumulate(cumulative)
+    drawdown = cumulative / running_max - 1
     max_drawdown = drawdown.min()
     
     # Sharpe Ratio (assuming 2% risk-free rate)
     risk_free_rate = 0.02
     excess_returns = returns - risk_free_rate/252
-    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / returns.std()
+    sharpe_ratio = np.sqrt(252) * safe_ratio(excess_returns.mean(), returns.std(ddof=1), default=np.nan)
     
     print(f"Value at Risk (95% confidence, daily): {var_95:.2%}")
     print(f"Maximum drawdown: {max_drawdown:.2%}")
@@ -109,38 +193,54 @@ def risk_analytics(df):
     print()
 
 # 5. TIME SERIES ANALYSIS
-def time_series_analysis(df):
+def time_series_analysis(ctx):
     """Trend and seasonality analysis"""
     print("=== 5. TIME SERIES ANALYTICS ===")
     
-    # Monthly returns pattern
-    monthly_returns = df['Close'].resample('M').last().pct_change()
-    avg_monthly_return = monthly_returns.groupby(monthly_returns.index.month).mean()
-    
-    best_month = avg_monthly_return.idxmax()
-    worst_month = avg_monthly_return.idxmin()
-    
-    print(f"Best performing month: {best_month} ({avg_monthly_return.max():.2%})")
-    print(f"Worst performing month: {worst_month} ({avg_monthly_return.min():.2%})")
-    
-    # Long-term trend
-    yearly_avg = df['Close'].resample('Y').mean()
-    recent_trend = yearly_avg.tail(5).pct_change().mean()
+    # Month-end closes: the last row before the (year, month) label changes
+    new_month = (np.diff(ctx.month) != 0) | (np.diff(ctx.year) != 0)
+    month_ends = np.append(np.flatnonzero(new_month), len(ctx.close) - 1)
+    month_end = ctx.close[month_ends]
+    monthly_returns = month_end[1:] / month_end[:-1] - 1
+    months = ctx.month[month_ends[1:]]
+    
+    # Monthly returns pattern, averaged per calendar month with 13-bin
+    # bincounts (bin 0 unused) instead of a groupby
+    valid = ~np.isnan(monthly_returns)
+    sums = np.bincount(months[valid], weights=monthly_returns[valid], minlength=13)
+    counts = np.bincount(months[valid], minlength=13)
+    avg_monthly_return = np.full(13, np.nan)
+    np.divide(sums, counts, out=avg_monthly_return, where=counts > 0)
+    
+    best_month = np.nanargmax(avg_monthly_return)
+    worst_month = np.nanargmin(avg_monthly_return)
+    
+    print(f"Best performing month: {best_month} ({avg_monthly_return[best_month]:.2%})")
+    print(f"Worst performing month: {worst_month} ({avg_monthly_return[worst_month]:.2%})")
+    
+    # Long-term trend from the yearly average closes
+    years = ctx.year - ctx.year.min()
+    counts = np.bincount(years)
+    sums = np.bincount(years, weights=ctx.close)
+    yearly_avg = sums[counts > 0] / counts[counts > 0]
+    recent = yearly_avg[-5:]
+    recent_trend = np.mean(recent[1:] / recent[:-1] - 1)
     
     print(f"Recent 5-year trend: {recent_trend:.2%} per year")
     print()
 
 # 6. VOLATILITY ANALYSIS
-def volatility_analysis(df):
+def volatility_analysis(ctx):
     """Volatility patterns and clustering"""
     print("=== 6. VOLATILITY ANALYTICS ===")
     
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['Volatility_30d'] = df['Daily_Return'].rolling(window=30).std() * np.sqrt(252)
+    window = 30
+    volatility_30d = pd.Series(ctx.ret).rolling(window=window).std().to_numpy() * np.sqrt(252)
+    filled = volatility_30d[~np.isnan(volatility_30d)]
     
-    current_vol = df['Volatility_30d'].iloc[-1]
-    avg_vol = df['Volatility_30d'].mean()
-    high_vol_threshold = df['Volatility_30d'].quantile(0.8)
+    current_vol = volatility_30d[-1]
+    avg_vol = filled.mean()
+    high_vol_threshold = quantile(filled, 0.8)
     
     print(f"Current 30-day volatility: {current_vol:.2%}")
     print(f"Average volatility: {avg_vol:.2%}")
@@ -153,23 +253,19 @@ def volatility_analysis(df):
     print()
 
 # 7. PREDICTIVE ANALYTICS
-def predictive_analytics(df):
+def predictive_analytics(ctx):
     """Simple prediction using moving averages"""
     print("=== 7. PREDICTIVE ANALYTICS ===")
     
     # Simple momentum strategy
-    df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    df['SMA_50'] = df['Close'].rolling(window=50).mean()
-    
-    # Generate signals
-    current_price = df['Close'].iloc[-1]
-    sma_20 = df['SMA_20'].iloc[-1]
-    sma_50 = df['SMA_50'].iloc[-1]
+    current_price = ctx.close[-1]
+    sma_20 = ctx.sma20[-1]
+    sma_50 = ctx.sma50[-1]
     
     # Golden Cross/Death Cross
-    if sma_20 > sma_50 and df['SMA_20'].iloc[-2] <= df['SMA_50'].iloc[-2]:
+    if sma_20 > sma_50 and ctx.sma20[-2] <= ctx.sma50[-2]:
         prediction = "GOLDEN CROSS - Bullish signal"
-    elif sma_20 < sma_50 and df['SMA_20'].iloc[-2] >= df['SMA_50'].iloc[-2]:
+    elif sma_20 < sma_50 and ctx.sma20[-2] >= ctx.sma50[-2]:
         prediction = "DEATH CROSS - Bearish signal"
     elif sma_20 > sma_50:
         prediction = "Bullish trend continuation"
@@ -182,23 +278,18 @@ def predictive_analytics(df):
     print()
 
 # 8. TRADING STRATEGY ANALYSIS
-def trading_strategy_analysis(df):
+def trading_strategy_analysis(ctx):
     """Backtest a simple trading strategy"""
     print("=== 8. TRADING STRATEGY ANALYTICS ===")
     
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    
-    # Strategy: Buy when price > SMA_20, Sell when price < SMA_20
-    df['Signal'] = np.where(df['Close'] > df['SMA_20'], 1, -1)
-    df['Strategy_Return'] = df['Signal'].shift(1) * df['Daily_Return']
+    # Strategy: Buy when price > SMA_20, Sell when price < SMA_20 (and while
+    # the SMA is still filling); branchless +1/-1 as int8
+    signal = ((ctx.close > ctx.sma20).astype(np.int8) << 1) - 1
+    strategy_cumulative, buy_hold_cumulative = _backtest_kernel(signal, ctx.ret)
     
     # Calculate performance
-    strategy_cumulative = (1 + df['Strategy_Return'].dropna()).cumprod()
-    buy_hold_cumulative = (1 + df['Daily_Return'].dropna()).cumprod()
-    
-    strategy_return = strategy_cumulative.iloc[-1] - 1
-    buy_hold_return = buy_hold_cumulative.iloc[-1] - 1
+    strategy_return = strategy_cumulative[-1] - 1
+    buy_hold_return = buy_hold_cumulative[-1] - 1
     
     print(f"Strategy total return: {strategy_return:.2%}")
     print(f"Buy & Hold return: {buy_hold_return:.2%}")
@@ -211,26 +302,22 @@ def trading_strategy_analysis(df):
     print()
 
 # 9. MARKET SENTIMENT ANALYSIS
-def market_sentiment_analysis(df):
+def market_sentiment_analysis(ctx):
     """Volume-price relationship analysis"""
     print("=== 9. MARKET SENTIMENT ANALYTICS ===")
     
     # Volume analysis
-    avg_volume = df['Volume'].mean()
-    current_volume = df['Volume'].iloc[-1]
-    volume_ratio = current_volume / avg_volume
+    volume = ctx.volume
+    avg_volume = np.nanmean(volume)
+    current_volume = volume[-1]
+    volume_ratio = safe_ratio(current_volume, avg_volume)
     
-    # Price change on high volume days
-    df['Daily_Return'] = df['Close'].pct_change()
-    high_volume_days = df['Volume'] > df['Volume'].quantile(0.8)
-    avg_return_high_vol = df['Daily_Return'][high_volume_days].mean()
+    # Price change on high volume days and up/down volume, in a single scan
+    avg_return_high_vol, up_volume, down_volume = _volume_sentiment_kernel(
+        np.ascontiguousarray(volume, dtype=np.float64), ctx.ret, quantile(volume[~np.isnan(volume)], 0.8))
     
     # Up/Down volume ratio
-    up_days = df['Daily_Return'] > 0
-    down_days = df['Daily_Return'] < 0
-    up_volume = df['Volume'][up_days].sum()
-    down_volume = df['Volume'][down_days].sum()
-    volume_ratio_up_down = up_volume / down_volume if down_volume > 0 else float('inf')
+    volume_ratio_up_down = safe_ratio(up_volume, down_volume)
     
     print(f"Current/Average volume ratio: {volume_ratio:.2f}")
     print(f"Average return on high-volume days: {avg_return_high_vol:.2%}")
@@ -245,23 +332,23 @@ def market_sentiment_analysis(df):
     print()
 
 # 10. MARKET REGIME ANALYSIS
-def market_regime_analysis(df):
+def market_regime_analysis(ctx):
     """Identify bull/bear market periods"""
     print("=== 10. MARKET REGIME ANALYTICS ===")
     
-    df['SMA_200'] = df['Close'].rolling(window=200).mean()
-    
     # Current regime
-    current_price = df['Close'].iloc[-1]
-    current_sma_200 = df['SMA_200'].iloc[-1]
+    current_price = ctx.close[-1]
+    current_sma_200 = ctx.sma200[-1]
     
-    # Count days in each regime
-    bull_days = (df['Close'] > df['SMA_200']).sum()
-    bear_days = (df['Close'] <= df['SMA_200']).sum()
-    total_days = len(df.dropna())
+    # Count days in each regime (those with a full 200-day window)
+    has_sma = ~np.isnan(ctx.sma200)
+    bull = ctx.close[has_sma] > ctx.sma200[has_sma]
+    total_days = bull.size
+    bull_days = np.count_nonzero(bull)
+    bear_days = total_days - bull_days
     
-    bull_percentage = bull_days / total_days * 100
-    bear_percentage = bear_days / total_days * 100
+    bull_percentage = safe_ratio(bull_days, total_days, default=np.nan) * 100
+    bear_percentage = safe_ratio(bear_days, total_days, default=np.nan) * 100
     
     print(f"Current price: ${current_price:.2f}")
     print(f"200-day SMA: ${current_sma_200:.2f}")
@@ -276,20 +363,21 @@ def market_regime_analysis(df):
     print()
 
 # 11. CORRELATION ANALYSIS
-def correlation_analysis(df):
+def correlation_analysis(ctx):
     """Price-volume correlation analysis"""
     print("=== 11. CORRELATION ANALYTICS ===")
     
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['Volume_Change'] = df['Volume'].pct_change()
+    # Everything aligned with the returns, i.e. from the second day on
+    volume = ctx.volume.astype(np.float64)
+    volume_change = np.diff(volume) / volume[:-1]
     
     # Correlations
-    price_volume_corr = df['Daily_Return'].corr(df['Volume_Change'])
-    price_level_volume_corr = df['Close'].pct_change().corr(df['Volume'])
+    price_volume_corr = corr(ctx.ret, volume_change)
+    price_level_volume_corr = corr(ctx.ret, volume[1:])
     
     # Autocorrelation
-    return_autocorr = df['Daily_Return'].autocorr(lag=1)
-    volume_autocorr = df['Volume'].pct_change().autocorr(lag=1)
+    return_autocorr = autocorr1(ctx.ret)
+    volume_autocorr = autocorr1(volume_change)
     
     print(f"Daily return vs volume change correlation: {price_volume_corr:.3f}")
     print(f"Price level vs volume correlation: {price_level_volume_corr:.3f}")
@@ -303,29 +391,28 @@ def correlation_analysis(df):
     print()
 
 # 12. PERFORMANCE BENCHMARKING
-def performance_benchmarking(df):
+def performance_benchmarking(ctx):
     """Benchmark against hypothetical market"""
     print("=== 12. PERFORMANCE BENCHMARKING ANALYTICS ===")
     
-    df['Daily_Return'] = df['Close'].pct_change()
+    returns = ctx.ret
     
     # Calculate metrics
-    total_return = (1 + df['Daily_Return']).cumprod().iloc[-1] - 1
-    annual_return = (1 + total_return) ** (252/len(df)) - 1
-    volatility = df['Daily_Return'].std() * np.sqrt(252)
+    total_return = np.prod(1 + returns) - 1
+    annual_return = (1 + total_return) ** (252/len(ctx.close)) - 1
+    volatility = returns.std(ddof=1) * np.sqrt(252)
     
     # Assume market returns 8% annually with 15% volatility
     market_annual_return = 0.08
     market_volatility = 0.15
     
-    # Calculate tracking error (simplified)
-    market_daily_return = market_annual_return / 252
-    market_returns = np.random.normal(market_daily_return, market_volatility/np.sqrt(252), len(df['Daily_Return'].dropna()))
-    tracking_error = np.std(df['Daily_Return'].dropna() - market_returns) * np.sqrt(252)
+    # Calculate tracking error (simplified): for a benchmark independent of the
+    # stock, var(stock - market) = var(stock) + var(market), so no simulation
+    tracking_error = np.sqrt(returns.var() * 252 + market_volatility**2)
     
     # Information ratio
     excess_return = annual_return - market_annual_return
-    information_ratio = excess_return / tracking_error if tracking_error > 0 else 0
+    information_ratio = safe_ratio(excess_return, tracking_error, default=0)
     
     print(f"Stock annual return: {annual_return:.2%}")
     print(f"Market benchmark return: {market_annual_return:.2%}")
@@ -339,6 +426,21 @@ def performance_benchmarking(df):
         print("Performance: UNDERPERFORMING market")
     print()
 
+ANALYTICS = [
+    descriptive_analytics,
+    performance_analytics,
+    technical_analysis,
+    risk_analytics,
+    time_series_analysis,
+    volatility_analysis,
+    predictive_analytics,
+    trading_strategy_analysis,
+    market_sentiment_analysis,
+    market_regime_analysis,
+    correlation_analysis,
+    performance_benchmarking
+]
+
 def main():
     """Run all analytics examples"""
     print("COMPREHENSIVE BUSINESS ANALYTICS FOR STOCK DATA")
@@ -347,20 +449,11 @@ def main():
     
     # Load data
     df = load_data('stock_data.xlsx')
+    ctx = build_context(df)
     
     # Run all analytics examples
-    descriptive_analytics(df)
-    performance_analytics(df)
-    technical_analysis(df)
-    risk_analytics(df)
-    time_series_analysis(df)
-    volatility_analysis(df)
-    predictive_analytics(df)
-    trading_strategy_analysis(df)
-    market_sentiment_analysis(df)
-    market_regime_analysis(df)
-    correlation_analysis(df)
-    performance_benchmarking(df)
+    for analytic in ANALYTICS:
+        analytic(ctx)
     
     print("=" * 60)
     print("ANALYSIS COMPLETE - All 12 analytics types demonstrated")
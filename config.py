@@ -33,7 +33,7 @@ RSI_PERIOD = 14
 VOLATILITY_WINDOW = 30
 
 # Chart Configuration
-CHART_DPI = int(os.environ.get("CHART_DPI", "300"))
+CHART_DPI = int(os.environ.get("CHART_DPI", "120"))
 CHART_STYLE = "seaborn-v0_8"
 CHART_FIGURE_SIZE = (12, 8)
 CHART_LINE_WIDTH = 2
@@ -102,9 +102,6 @@ def ensure_directories():
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
 
-# Initialize directories
-ensure_directories()
-
 # Configuration Validation
 def validate_config():
     """Validate configuration settings"""
@@ -1,12 +1,12 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from datetime import datetime
+from dataclasses import dataclass
 import warnings
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.chart import LineChart, BarChart, Reference
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
+from utils import njit, read_packed_workbook, sma, calculate_rsi, quantile
 import os
 warnings.filterwarnings('ignore')
 
@@ -15,69 +15,150 @@ if not os.path.exists('reports'):
     os.makedirs('reports')
     os.makedirs('reports/charts')
 
-# Excel styling functions
-def get_header_style():
-    return Font(name='Calibri', size=12, bold=True, color='FFFFFF'), \
-           PatternFill(start_color='2F75B5', end_color='2F75B5', fill_type='solid'), \
-           Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin')), \
-           Alignment(horizontal='center', vertical='center')
-
-def get_title_style():
-    return Font(name='Calibri', size=14, bold=True, color='000000'), \
-           PatternFill(start_color='DDEBF7', end_color='DDEBF7', fill_type='solid'), \
-           Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin')), \
-           Alignment(horizontal='center', vertical='center')
-
-def get_data_style():
-    return Font(name='Calibri', size=10, color='000000'), \
-           PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid'), \
-           Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin')), \
-           Alignment(horizontal='left', vertical='center')
-
-def get_number_style():
-    return Font(name='Calibri', size=10, color='000000'), \
-           PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid'), \
-           Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin')), \
-           Alignment(horizontal='right', vertical='center')
+# Excel styles, built once and shared by every report
+THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+CENTER = Alignment(horizontal='center', vertical='center')
+
+DATA_FONT = Font(name='Calibri', size=10, color='000000')
+NUMBER_FILL = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
+LEFT = Alignment(horizontal='left', vertical='center')
+
+# Named styles are registered with the workbook once, so every cell refers
+# to one shared style record instead of carrying its own four attributes
+HEADER_STYLE = NamedStyle(name='Report Header',
+                          font=Font(name='Calibri', size=12, bold=True, color='FFFFFF'),
+                          fill=PatternFill(start_color='2F75B5', end_color='2F75B5', fill_type='solid'),
+                          border=THIN_BORDER, alignment=CENTER)
+
+TITLE_STYLE = NamedStyle(name='Report Title',
+                         font=Font(name='Calibri', size=14, bold=True, color='000000'),
+                         fill=PatternFill(start_color='DDEBF7', end_color='DDEBF7', fill_type='solid'),
+                         border=THIN_BORDER, alignment=CENTER)
+
+DATA_STYLE = NamedStyle(name='Report Data', font=DATA_FONT,
+                        fill=PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid'),
+                        border=THIN_BORDER, alignment=LEFT)
+
+NUMBER_STYLE = NamedStyle(name='Report Number', font=DATA_FONT, fill=NUMBER_FILL, border=THIN_BORDER,
+                          alignment=Alignment(horizontal='right', vertical='center'))
+
+# describe() values: number font and fill, data alignment
+STAT_STYLE = NamedStyle(name='Report Statistic', font=DATA_FONT, fill=NUMBER_FILL, border=THIN_BORDER,
+                        alignment=LEFT, number_format='#,##0.00')
+
+NAMED_STYLES = (HEADER_STYLE, TITLE_STYLE, DATA_STYLE, NUMBER_STYLE, STAT_STYLE)
+
+# Conditional fills and banner fonts
+POS_FILL = PatternFill(start_color='C6E0B4', end_color='C6E0B4', fill_type='solid')
+NEG_FILL = PatternFill(start_color='F8CBAD', end_color='F8CBAD', fill_type='solid')
+WARN_FILL = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+BULL_FILL = PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid')
+BEAR_FILL = PatternFill(start_color='E74C3C', end_color='E74C3C', fill_type='solid')
+SIGNAL_FONT = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
+RESULT_FONT = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
+
+def styled_cell(ws, value, style, number_format=None):
+    """Build a write-only cell in one of the registered named styles"""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style.name
+    if number_format:
+        cell.number_format = number_format
+    return cell
 
 # Load and prepare the data
 def load_data(filepath):
-    df = pd.read_excel(filepath)
-    df_split = df.iloc[:, 0].str.split(',', expand=True)
-    df_split.columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-    df_split['Date'] = pd.to_datetime(df_split['Date'])
-    for col in ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']:
-        df_split[col] = pd.to_numeric(df_split[col], errors='coerce')
-    df_split.set_index('Date', inplace=True)
-    return df_split
+    """Read the CSV-packed workbook straight into a typed frame"""
+    return read_packed_workbook(filepath, price_dtype=np.float64, volume_dtype=np.float64)
+
+# Shared inputs
+@dataclass
+class Ctx:
+    """Close-derived arrays shared by the reports, computed once in main()
+
+    ``ret`` holds the n-1 daily returns aligned with ``index[1:]``; the SMAs
+    and ``vol30`` are NaN until their window fills. ``month``/``year`` are the
+    calendar labels of each row, decoded from the index once.
+    """
+    month: np.ndarray
+    year: np.ndarray
+    close: np.ndarray
+    ret: np.ndarray
+    sma20: np.ndarray
+    sma50: np.ndarray
+    vol30: np.ndarray
+
+def build_context(df):
+    """Compute returns, SMAs and rolling volatility a single time"""
+    close = df['Close'].to_numpy(dtype=np.float64)
+    # Carry the last close over blank ones, as pct_change's deprecated default did
+    filled = df['Close'].ffill().to_numpy(dtype=np.float64)
+    ret = filled[1:] / filled[:-1] - 1
+    return Ctx(
+        month=df.index.month.to_numpy().astype(np.int8),
+        year=df.index.year.to_numpy().astype(np.int16),
+        close=close,
+        ret=ret,
+        sma20=sma(close, 20),
+        sma50=sma(close, 50),
+        vol30=pd.Series(ret).rolling(window=30).std().to_numpy() * np.sqrt(252)
+    )
+
+# Indicator kernels
+@njit(cache=True)
+def _strategy_kernel(close, sma20, ret):
+    """Final growth of the SMA-20 long/short strategy and of buy & hold
+
+    Each day trades on the previous day's close-vs-SMA signal; a missing
+    SMA counts as short, as the comparison is False.
+    """
+    strategy = 1.0
+    buy_hold = 1.0
+    for i in range(1, close.shape[0]):
+        r = ret[i-1]
+        if close[i-1] > sma20[i-1]:
+            strategy *= 1 + r
+        else:
+            strategy *= 1 - r
+        buy_hold *= 1 + r
+    return strategy, buy_hold
+
+@njit(cache=True)
+def _max_drawdown_kernel(ret):
+    """Deepest fall of the compounded returns below their running peak, in one pass"""
+    cum = 1.0
+    peak = 0.0
+    mdd = 0.0
+    for i in range(ret.shape[0]):
+        cum *= 1 + ret[i]
+        if cum > peak:
+            peak = cum
+        dd = (cum - peak) / peak
+        if dd < mdd:
+            mdd = dd
+    return mdd
+
+def max_drawdown(ret):
+    """Maximum drawdown of a daily return array"""
+    return _max_drawdown_kernel(np.ascontiguousarray(ret, dtype=np.float64))
 
 # 1. DESCRIPTIVE ANALYTICS
-def descriptive_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Descriptive Analytics"
+def descriptive_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Descriptive Analytics")
+    
+    # Column widths must be set before the first row is streamed; the
+    # widest table is the statistics one, with a label column and 4 prices
+    for col in range(1, 6):
+        ws.column_dimensions[get_column_letter(col)].width = 15
     
     # Title
-    ws.merge_cells('A1:D1')
-    title_cell = ws['A1']
-    title_cell.value = "DESCRIPTIVE ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:D1')
+    ws.append([styled_cell(ws, "DESCRIPTIVE ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Basic Statistics
     row = 3
     headers = ['Metric', 'Value', 'Metric', 'Value']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     data = [
@@ -88,99 +169,56 @@ def descriptive_analytics_excel(df):
         ['Average Closing Price', f"${df['Close'].mean():.2f}"]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
-    number_font, number_fill, number_border, number_align = get_number_style()
-    
-    for i, (metric, value) in enumerate(data):
+    for metric, value in data:
         row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        # Value
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = number_font
-        cell.fill = number_fill
-        cell.border = number_border
-        cell.alignment = number_align
+        ws.append([styled_cell(ws, metric, DATA_STYLE), styled_cell(ws, value, NUMBER_STYLE)])
     
     # Statistics Table
     row += 2
-    ws.merge_cells(f'A{row}:D{row}')
-    subtitle = ws.cell(row=row, column=1, value="Price Statistics")
-    subtitle.font = title_font
-    subtitle.fill = title_fill
-    subtitle.border = title_border
-    subtitle.alignment = title_align
-    
-    row += 1
-    stats = df[['Open', 'High', 'Low', 'Close']].describe()
-    for r in dataframe_to_rows(stats, index=True, header=True):
-        for c, value in enumerate(r, 1):
-            if row == 9:  # Header row
-                cell = ws.cell(row=row, column=c, value=value)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = header_border
-                cell.alignment = header_align
-            else:
-                cell = ws.cell(row=row, column=c, value=value)
-                if isinstance(value, (int, float)):
-                    cell.font = number_font
-                    cell.fill = number_fill
-                    cell.number_format = '#,##0.00'
-                else:
-                    cell.font = data_font
-                    cell.fill = data_fill
-                cell.border = data_border
-                cell.alignment = data_align
-        row += 1
-    
-    # Adjust column widths
-    for col in range(1, 9):
-        ws.column_dimensions[chr(64 + col)].width = 15
+    ws.append([])
+    ws.merged_cells.add(f'A{row}:D{row}')
+    ws.append([styled_cell(ws, "Price Statistics", TITLE_STYLE)])
+    
+    # The describe() table, computed column-wise on one (N, 4) array
+    columns = ['Open', 'High', 'Low', 'Close']
+    prices = df[columns].to_numpy()
+    # NaN-skipping reductions, as describe() ignores blank cells
+    stats = np.vstack([
+        np.count_nonzero(~np.isnan(prices), axis=0).astype(np.float64),
+        np.nanmean(prices, axis=0),
+        np.nanstd(prices, axis=0, ddof=1),
+        np.nanmin(prices, axis=0),
+        np.nanpercentile(prices, [25, 50, 75], axis=0),
+        np.nanmax(prices, axis=0)
+    ])
+    ws.append([styled_cell(ws, value, HEADER_STYLE) for value in (None, *columns)])
+    for name, values in zip(['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'], stats.tolist()):
+        ws.append([styled_cell(ws, name, DATA_STYLE)] +
+                  [styled_cell(ws, value, STAT_STYLE) for value in values])
     
-    wb.save('reports/01_descriptive_analytics.xlsx')
     return "Descriptive Analytics Excel report generated"
 
 # 2. PERFORMANCE ANALYTICS
-def performance_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Performance Analytics"
+def performance_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Performance Analytics")
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 15
     
     # Title
-    ws.merge_cells('A1:B1')
-    title_cell = ws['A1']
-    title_cell.value = "PERFORMANCE ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:B1')
+    ws.append([styled_cell(ws, "PERFORMANCE ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Calculate metrics
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['Cumulative_Return'] = (1 + df['Daily_Return']).cumprod()
+    growth = np.prod(1 + ctx.ret)
     
-    total_return = df['Cumulative_Return'].iloc[-1] - 1
-    annual_return = (df['Cumulative_Return'].iloc[-1] ** (252/len(df))) - 1
-    volatility = df['Daily_Return'].std() * np.sqrt(252)
+    total_return = growth - 1
+    annual_return = (growth ** (252/len(df))) - 1
+    volatility = ctx.ret.std(ddof=1) * np.sqrt(252)
     
     # Headers
-    row = 3
     headers = ['Performance Metric', 'Value']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     data = [
@@ -189,81 +227,41 @@ def performance_analytics_excel(df):
         ['Annualized Volatility', volatility]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
-    
-    for i, (metric, value) in enumerate(data):
-        row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
+    for metric, value in data:
         # Value (as percentage)
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        cell.number_format = '0.00%'
-        
+        cell = styled_cell(ws, value, DATA_STYLE, '0.00%')
+    
         # Color coding
         if value > 0:
-            cell.fill = PatternFill(start_color='C6E0B4', end_color='C6E0B4', fill_type='solid')
+            cell.fill = POS_FILL
         else:
-            cell.fill = PatternFill(start_color='F8CBAD', end_color='F8CBAD', fill_type='solid')
+            cell.fill = NEG_FILL
     
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 15
+        ws.append([styled_cell(ws, metric, DATA_STYLE), cell])
     
-    wb.save('reports/02_performance_analytics.xlsx')
     return "Performance Analytics Excel report generated"
 
 # 3. TECHNICAL ANALYTICS
-def technical_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Technical Analytics"
+def technical_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Technical Analytics")
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 15
     
     # Title
-    ws.merge_cells('A1:B1')
-    title_cell = ws['A1']
-    title_cell.value = "TECHNICAL ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:B1')
+    ws.append([styled_cell(ws, "TECHNICAL ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Calculate indicators
-    df['SMA_50'] = df['Close'].rolling(window=50).mean()
-    
-    def calculate_rsi(data, window=14):
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-    
-    df['RSI'] = calculate_rsi(df['Close'])
+    rsi = calculate_rsi(ctx.close)
     
-    current_price = df['Close'].iloc[-1]
-    current_sma = df['SMA_50'].iloc[-1]
-    current_rsi = df['RSI'].iloc[-1]
+    current_price = ctx.close[-1]
+    current_sma = ctx.sma50[-1]
+    current_rsi = rsi[-1]
     
     # Headers
-    row = 3
     headers = ['Technical Indicator', 'Current Value']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     data = [
@@ -272,246 +270,150 @@ def technical_analytics_excel(df):
         ['RSI (14-day)', current_rsi]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
-    
-    for i, (metric, value) in enumerate(data):
-        row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        # Value
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
+    for metric, value in data:
         if 'Price' in metric or 'SMA' in metric:
-            cell.number_format = '$#,##0.00'
+            number_format = '$#,##0.00'
         elif 'RSI' in metric:
-            cell.number_format = '0.0'
+            number_format = '0.0'
+        ws.append([styled_cell(ws, metric, DATA_STYLE), styled_cell(ws, value, DATA_STYLE, number_format)])
     
     # Signal
-    row += 2
+    ws.append([])
     signal = "BULLISH" if current_price > current_sma else "BEARISH"
-    signal_cell = ws.cell(row=row, column=1, value="Trading Signal")
-    signal_cell.font = data_font
-    signal_cell.fill = data_fill
-    signal_cell.border = data_border
-    signal_cell.alignment = data_align
-    
-    signal_value = ws.cell(row=row, column=2, value=signal)
-    signal_value.font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
+    signal_value = styled_cell(ws, signal, DATA_STYLE)
+    signal_value.font = SIGNAL_FONT
     if signal == "BULLISH":
-        signal_value.fill = PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid')
+        signal_value.fill = BULL_FILL
     else:
-        signal_value.fill = PatternFill(start_color='E74C3C', end_color='E74C3C', fill_type='solid')
-    signal_value.border = data_border
-    signal_value.alignment = header_align
-    
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 15
+        signal_value.fill = BEAR_FILL
+    signal_value.alignment = CENTER
+    ws.append([styled_cell(ws, "Trading Signal", DATA_STYLE), signal_value])
     
-    wb.save('reports/03_technical_analytics.xlsx')
     return "Technical Analytics Excel report generated"
 
 # 4. RISK ANALYTICS
-def risk_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Risk Analytics"
+def risk_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Risk Analytics")
+    ws.column_dimensions['A'].width = 30
+    ws.column_dimensions['B'].width = 15
     
     # Title
-    ws.merge_cells('A1:B1')
-    title_cell = ws['A1']
-    title_cell.value = "RISK ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:B1')
+    ws.append([styled_cell(ws, "RISK ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Calculate risk metrics
-    returns = df['Close'].pct_change().dropna()
-    var_95 = np.percentile(returns, 5)
-    
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    max_drawdown = drawdown.min()
+    returns = ctx.ret
+    var_95 = quantile(returns, 0.05)
+    max_dd = max_drawdown(returns)
     
     risk_free_rate = 0.02
     excess_returns = returns - risk_free_rate/252
-    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / returns.std()
+    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / returns.std(ddof=1)
     
     # Headers
-    row = 3
     headers = ['Risk Metric', 'Value']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     data = [
         ['Value at Risk (95% daily)', var_95],
-        ['Maximum Drawdown', max_drawdown],
+        ['Maximum Drawdown', max_dd],
         ['Sharpe Ratio', sharpe_ratio]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
+    for metric, value in data:
+        cell = styled_cell(ws, value, DATA_STYLE, '0.00' if 'Ratio' in metric else '0.00%')
     
-    for i, (metric, value) in enumerate(data):
-        row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        # Value
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        if 'Ratio' in metric:
-            cell.number_format = '0.00'
-        else:
-            cell.number_format = '0.00%'
-        
         # Color coding for risk metrics
         if 'Drawdown' in metric or 'VaR' in metric:
-            cell.fill = PatternFill(start_color='F8CBAD', end_color='F8CBAD', fill_type='solid')
+            cell.fill = NEG_FILL
         elif 'Sharpe' in metric:
             if value > 1:
-                cell.fill = PatternFill(start_color='C6E0B4', end_color='C6E0B4', fill_type='solid')
+                cell.fill = POS_FILL
             elif value > 0:
-                cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+                cell.fill = WARN_FILL
             else:
-                cell.fill = PatternFill(start_color='F8CBAD', end_color='F8CBAD', fill_type='solid')
+                cell.fill = NEG_FILL
     
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 15
+        ws.append([styled_cell(ws, metric, DATA_STYLE), cell])
     
-    wb.save('reports/04_risk_analytics.xlsx')
     return "Risk Analytics Excel report generated"
 
 # 5. TIME SERIES ANALYTICS
-def time_series_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Time Series Analytics"
+def time_series_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Time Series Analytics")
+    ws.column_dimensions['A'].width = 30
+    ws.column_dimensions['B'].width = 20
     
     # Title
-    ws.merge_cells('A1:B1')
-    title_cell = ws['A1']
-    title_cell.value = "TIME SERIES ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:B1')
+    ws.append([styled_cell(ws, "TIME SERIES ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Calculate monthly patterns
-    monthly_returns = df['Close'].resample('M').last().pct_change()
-    avg_monthly_return = monthly_returns.groupby(monthly_returns.index.month).mean()
-    
-    best_month = avg_monthly_return.idxmax()
-    worst_month = avg_monthly_return.idxmin()
-    
-    yearly_avg = df['Close'].resample('Y').mean()
-    recent_trend = yearly_avg.tail(5).pct_change().mean()
+    # Month-end closes: the last row before the (year, month) label changes
+    new_month = (np.diff(ctx.month) != 0) | (np.diff(ctx.year) != 0)
+    month_ends = np.append(np.flatnonzero(new_month), len(ctx.close) - 1)
+    month_end = ctx.close[month_ends]
+    monthly_returns = month_end[1:] / month_end[:-1] - 1
+    labels = ctx.month[month_ends[1:]]
+    
+    # Average per calendar month with 13-bin bincounts (bin 0 unused)
+    sums = np.bincount(labels, weights=monthly_returns, minlength=13)
+    counts = np.bincount(labels, minlength=13)
+    avg_monthly_return = np.full(13, np.nan)
+    np.divide(sums, counts, out=avg_monthly_return, where=counts > 0)
+    
+    best_month = np.nanargmax(avg_monthly_return)
+    worst_month = np.nanargmin(avg_monthly_return)
+    
+    # Long-term trend from the yearly average closes
+    years = ctx.year - ctx.year.min()
+    counts = np.bincount(years)
+    sums = np.bincount(years, weights=ctx.close)
+    yearly_avg = sums[counts > 0] / counts[counts > 0]
+    recent = yearly_avg[-5:]
+    recent_trend = np.mean(recent[1:] / recent[:-1] - 1)
     
     # Headers
-    row = 3
     headers = ['Time Series Metric', 'Value']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     data = [
-        ['Best Performing Month', f"{months[best_month-1]} ({avg_monthly_return.max():.2%})"],
-        ['Worst Performing Month', f"{months[worst_month-1]} ({avg_monthly_return.min():.2%})"],
+        ['Best Performing Month', f"{months[best_month-1]} ({avg_monthly_return[best_month]:.2%})"],
+        ['Worst Performing Month', f"{months[worst_month-1]} ({avg_monthly_return[worst_month]:.2%})"],
         ['Recent 5-Year Trend', f"{recent_trend:.2%} per year"]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
-    
-    for i, (metric, value) in enumerate(data):
-        row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        # Value
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-    
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 20
+    for metric, value in data:
+        ws.append([styled_cell(ws, metric, DATA_STYLE), styled_cell(ws, value, DATA_STYLE)])
     
-    wb.save('reports/05_time_series_analytics.xlsx')
     return "Time Series Analytics Excel report generated"
 
 # 6. VOLATILITY ANALYTICS
-def volatility_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Volatility Analytics"
+def volatility_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Volatility Analytics")
+    ws.column_dimensions['A'].width = 35
+    ws.column_dimensions['B'].width = 20
     
     # Title
-    ws.merge_cells('A1:B1')
-    title_cell = ws['A1']
-    title_cell.value = "VOLATILITY ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:B1')
+    ws.append([styled_cell(ws, "VOLATILITY ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Calculate volatility metrics
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['Volatility_30d'] = df['Daily_Return'].rolling(window=30).std() * np.sqrt(252)
+    filled = ctx.vol30[~np.isnan(ctx.vol30)]
     
-    current_vol = df['Volatility_30d'].iloc[-1]
-    avg_vol = df['Volatility_30d'].mean()
-    high_vol_threshold = df['Volatility_30d'].quantile(0.8)
+    current_vol = ctx.vol30[-1]
+    avg_vol = filled.mean()
+    high_vol_threshold = quantile(filled, 0.8)
     
     # Headers
-    row = 3
     headers = ['Volatility Metric', 'Value']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     data = [
@@ -520,105 +422,64 @@ def volatility_analytics_excel(df):
         ['High Volatility Threshold (80th %)', high_vol_threshold]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
+    for metric, value in data:
+        cell = styled_cell(ws, value, DATA_STYLE, '0.00%')
     
-    for i, (metric, value) in enumerate(data):
-        row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        # Value
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        cell.number_format = '0.00%'
-        
         # Color coding for volatility
         if 'Current' in metric:
             if value > high_vol_threshold:
-                cell.fill = PatternFill(start_color='F8CBAD', end_color='F8CBAD', fill_type='solid')
+                cell.fill = NEG_FILL
             else:
-                cell.fill = PatternFill(start_color='C6E0B4', end_color='C6E0B4', fill_type='solid')
+                cell.fill = POS_FILL
+    
+        ws.append([styled_cell(ws, metric, DATA_STYLE), cell])
     
     # Market condition
-    row += 2
+    ws.append([])
     condition = "HIGH VOLATILITY" if current_vol > high_vol_threshold else "NORMAL VOLATILITY"
-    condition_cell = ws.cell(row=row, column=1, value="Market Condition")
-    condition_cell.font = data_font
-    condition_cell.fill = data_fill
-    condition_cell.border = data_border
-    condition_cell.alignment = data_align
-    
-    condition_value = ws.cell(row=row, column=2, value=condition)
-    condition_value.font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
+    condition_value = styled_cell(ws, condition, DATA_STYLE)
+    condition_value.font = SIGNAL_FONT
     if condition == "HIGH VOLATILITY":
-        condition_value.fill = PatternFill(start_color='E74C3C', end_color='E74C3C', fill_type='solid')
+        condition_value.fill = BEAR_FILL
     else:
-        condition_value.fill = PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid')
-    condition_value.border = data_border
-    condition_value.alignment = header_align
-    
-    ws.column_dimensions['A'].width = 35
-    ws.column_dimensions['B'].width = 20
+        condition_value.fill = BULL_FILL
+    condition_value.alignment = CENTER
+    ws.append([styled_cell(ws, "Market Condition", DATA_STYLE), condition_value])
     
-    wb.save('reports/06_volatility_analytics.xlsx')
     return "Volatility Analytics Excel report generated"
 
 # 7. PREDICTIVE ANALYTICS
-def predictive_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Predictive Analytics"
+def predictive_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Predictive Analytics")
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 25
     
     # Title
-    ws.merge_cells('A1:B1')
-    title_cell = ws['A1']
-    title_cell.value = "PREDICTIVE ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:B1')
+    ws.append([styled_cell(ws, "PREDICTIVE ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Calculate moving averages
-    df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    df['SMA_50'] = df['Close'].rolling(window=50).mean()
-    
-    current_price = df['Close'].iloc[-1]
-    sma_20 = df['SMA_20'].iloc[-1]
-    sma_50 = df['SMA_50'].iloc[-1]
+    prev_20, sma_20 = ctx.sma20[-2:]
+    prev_50, sma_50 = ctx.sma50[-2:]
     
     # Determine prediction
-    if sma_20 > sma_50 and df['SMA_20'].iloc[-2] <= df['SMA_50'].iloc[-2]:
+    if sma_20 > sma_50 and prev_20 <= prev_50:
         prediction = "GOLDEN CROSS - Bullish signal"
-        prediction_color = '70AD47'
-    elif sma_20 < sma_50 and df['SMA_20'].iloc[-2] >= df['SMA_50'].iloc[-2]:
+        prediction_fill = BULL_FILL
+    elif sma_20 < sma_50 and prev_20 >= prev_50:
         prediction = "DEATH CROSS - Bearish signal"
-        prediction_color = 'E74C3C'
+        prediction_fill = BEAR_FILL
     elif sma_20 > sma_50:
         prediction = "Bullish trend continuation"
-        prediction_color = 'C6E0B4'
+        prediction_fill = POS_FILL
     else:
         prediction = "Bearish trend continuation"
-        prediction_color = 'F8CBAD'
+        prediction_fill = NEG_FILL
     
     # Headers
-    row = 3
     headers = ['Predictive Indicator', 'Current Value']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     data = [
@@ -626,86 +487,40 @@ def predictive_analytics_excel(df):
         ['50-day SMA', sma_50]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
-    
-    for i, (metric, value) in enumerate(data):
-        row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        # Value
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        cell.number_format = '$#,##0.00'
+    for metric, value in data:
+        ws.append([styled_cell(ws, metric, DATA_STYLE), styled_cell(ws, value, DATA_STYLE, '$#,##0.00')])
     
     # Prediction
-    row += 2
-    pred_cell = ws.cell(row=row, column=1, value="Prediction")
-    pred_cell.font = data_font
-    pred_cell.fill = data_fill
-    pred_cell.border = data_border
-    pred_cell.alignment = data_align
-    
-    pred_value = ws.cell(row=row, column=2, value=prediction)
-    pred_value.font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-    pred_value.fill = PatternFill(start_color=prediction_color, end_color=prediction_color, fill_type='solid')
-    pred_value.border = data_border
-    pred_value.alignment = header_align
+    ws.append([])
+    pred_value = styled_cell(ws, prediction, DATA_STYLE)
+    pred_value.font = RESULT_FONT
+    pred_value.fill = prediction_fill
+    pred_value.alignment = CENTER
+    ws.append([styled_cell(ws, "Prediction", DATA_STYLE), pred_value])
     
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 25
-    
-    wb.save('reports/07_predictive_analytics.xlsx')
     return "Predictive Analytics Excel report generated"
 
 # 8. TRADING STRATEGY ANALYTICS
-def trading_strategy_analytics_excel(df):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Trading Strategy Analytics"
+def trading_strategy_analytics_excel(wb, df, ctx):
+    ws = wb.create_sheet(title="Trading Strategy Analytics")
+    ws.column_dimensions['A'].width = 30
+    ws.column_dimensions['B'].width = 20
     
     # Title
-    ws.merge_cells('A1:B1')
-    title_cell = ws['A1']
-    title_cell.value = "TRADING STRATEGY ANALYTICS REPORT"
-    title_font, title_fill, title_border, title_align = get_title_style()
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.border = title_border
-    title_cell.alignment = title_align
+    ws.merged_cells.add('A1:B1')
+    ws.append([styled_cell(ws, "TRADING STRATEGY ANALYTICS REPORT", TITLE_STYLE)])
+    ws.append([])
     
     # Calculate strategy performance
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    
-    df['Signal'] = np.where(df['Close'] > df['SMA_20'], 1, -1)
-    df['Strategy_Return'] = df['Signal'].shift(1) * df['Daily_Return']
-    
-    strategy_cumulative = (1 + df['Strategy_Return'].dropna()).cumprod()
-    buy_hold_cumulative = (1 + df['Daily_Return'].dropna()).cumprod()
+    strategy_growth, buy_hold_growth = _strategy_kernel(ctx.close, ctx.sma20, ctx.ret)
     
-    strategy_return = strategy_cumulative.iloc[-1] - 1
-    buy_hold_return = buy_hold_cumulative.iloc[-1] - 1
+    strategy_return = strategy_growth - 1
+    buy_hold_return = buy_hold_growth - 1
     outperformance = strategy_return - buy_hold_return
     
     # Headers
-    row = 3
     headers = ['Strategy Performance', 'Return']
-    header_font, header_fill, header_border, header_align = get_header_style()
-    
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = header_border
-        cell.alignment = header_align
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
     
     # Data
     data = [
@@ -714,55 +529,55 @@ def trading_strategy_analytics_excel(df):
         ['Strategy Outperformance', outperformance]
     ]
     
-    data_font, data_fill, data_border, data_align = get_data_style()
+    for metric, value in data:
+        cell = styled_cell(ws, value, DATA_STYLE, '0.00%')
     
-    for i, (metric, value) in enumerate(data):
-        row += 1
-        # Metric
-        cell = ws.cell(row=row, column=1, value=metric)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        
-        # Value
-        cell = ws.cell(row=row, column=2, value=value)
-        cell.font = data_font
-        cell.fill = data_fill
-        cell.border = data_border
-        cell.alignment = data_align
-        cell.number_format = '0.00%'
-        
         # Color coding
         if 'Outperformance' in metric:
             if value > 0:
-                cell.fill = PatternFill(start_color='C6E0B4', end_color='C6E0B4', fill_type='solid')
+                cell.fill = POS_FILL
             else:
-                cell.fill = PatternFill(start_color='F8CBAD', end_color='F8CBAD', fill_type='solid')
+                cell.fill = NEG_FILL
+    
+        ws.append([styled_cell(ws, metric, DATA_STYLE), cell])
     
     # Result
-    row += 2
+    ws.append([])
     result = "Strategy BEATS Buy & Hold" if strategy_return > buy_hold_return else "Buy & Hold BEATS Strategy"
-    result_color = '70AD47' if strategy_return > buy_hold_return else 'F8CBAD'
-    
-    result_cell = ws.cell(row=row, column=1, value="Final Result")
-    result_cell.font = data_font
-    result_cell.fill = data_fill
-    result_cell.border = data_border
-    result_cell.alignment = data_align
+    result_fill = BULL_FILL if strategy_return > buy_hold_return else NEG_FILL
     
-    result_value = ws.cell(row=row, column=2, value=result)
-    result_value.font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-    result_value.fill = PatternFill(start_color=result_color, end_color=result_color, fill_type='solid')
-    result_value.border = data_border
-    result_value.alignment = header_align
+    result_value = styled_cell(ws, result, DATA_STYLE)
+    result_value.font = RESULT_FONT
+    result_value.fill = result_fill
+    result_value.alignment = CENTER
+    ws.append([styled_cell(ws, "Final Result", DATA_STYLE), result_value])
     
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 20
-    
-    wb.save('reports/08_trading_strategy_analytics.xlsx')
     return "Trading Strategy Analytics Excel report generated"
 
+REPORTS = [
+    descriptive_analytics_excel,
+    performance_analytics_excel,
+    technical_analytics_excel,
+    risk_analytics_excel,
+    time_series_analytics_excel,
+    volatility_analytics_excel,
+    predictive_analytics_excel,
+    trading_strategy_analytics_excel
+]
+
+def run_reports(df, ctx):
+    """Write every report as a sheet of one workbook
+
+    A single save pays the zip and stylesheet overhead once rather than
+    once per report.
+    """
+    wb = Workbook(write_only=True)
+    for style in NAMED_STYLES:
+        wb.add_named_style(style)
+    reports = [report(wb, df, ctx) for report in REPORTS]
+    wb.save('reports/analytics.xlsx')
+    return reports
+
 def main():
     print("GENERATING EXCEL BUSINESS ANALYTICS REPORTS")
     print("=" * 50)
@@ -770,28 +585,22 @@ def main():
     
     # Load data
     df = load_data('DevicesData.xlsx')
+    ctx = build_context(df)
     
     # Generate Excel reports
-    reports = []
-    reports.append(descriptive_analytics_excel(df))
-    reports.append(performance_analytics_excel(df))
-    reports.append(technical_analytics_excel(df))
-    reports.append(risk_analytics_excel(df))
-    reports.append(time_series_analytics_excel(df))
-    reports.append(volatility_analytics_excel(df))
-    reports.append(predictive_analytics_excel(df))
-    reports.append(trading_strategy_analytics_excel(df))
+    reports = run_reports(df, ctx)
     
     print("✓ All 8 Excel reports generated successfully!")
-    print("Generated Files:")
-    print("  - reports/01_descriptive_analytics.xlsx")
-    print("  - reports/02_performance_analytics.xlsx")
-    print("  - reports/03_technical_analytics.xlsx")
-    print("  - reports/04_risk_analytics.xlsx")
-    print("  - reports/05_time_series_analytics.xlsx")
-    print("  - reports/06_volatility_analytics.xlsx")
-    print("  - reports/07_predictive_analytics.xlsx")
-    print("  - reports/08_trading_strategy_analytics.xlsx")
+    print("Generated File: reports/analytics.xlsx")
+    print("Sheets:")
+    print("  - Descriptive Analytics")
+    print("  - Performance Analytics")
+    print("  - Technical Analytics")
+    print("  - Risk Analytics")
+    print("  - Time Series Analytics")
+    print("  - Volatility Analytics")
+    print("  - Predictive Analytics")
+    print("  - Trading Strategy Analytics")
     print()
     print("Features:")
     print("  - Professional color schemes")
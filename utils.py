@@ -0,0 +1,190 @@
+"""
+Shared helpers for the analytics and reporting scripts
+"""
+
+import io
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from config import ENABLE_CACHING
+
+# Parse CSV with Arrow's multithreaded reader when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Adj Close']
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        return lambda func: func
+
+def safe_ratio(numerator, denominator, default=np.inf):
+    """Divide, giving ``default`` wherever the denominator is zero
+
+    Works element-wise on arrays as well as on scalars, so the same
+    zero-denominator rule holds for one ticker or many.
+    """
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.full(np.broadcast(numerator, denominator).shape, default, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out.item() if out.ndim == 0 else out
+
+def cached_frame(path, suffix, reader):
+    """Parse ``path`` with ``reader``, keeping the result in a parquet cache
+
+    With ENABLE_CACHING on, the frame is stored next to ``path`` under
+    ``suffix`` and reused for as long as it is newer than ``path``.
+    """
+    cache = Path(path).with_suffix(suffix)
+    if ENABLE_CACHING and cache.exists() and cache.stat().st_mtime >= os.path.getmtime(path):
+        try:
+            return pd.read_parquet(cache)
+        except Exception as e:
+            print(f"Ignoring unreadable data cache {cache}: {e}")
+    
+    df = reader(path)
+    if ENABLE_CACHING:
+        try:
+            df.to_parquet(cache, compression='zstd')
+        except Exception as e:
+            print(f"Could not write data cache {cache}: {e}")
+    return df
+
+def read_packed_workbook(filepath, price_dtype=np.float32, volume_dtype=None):
+    """Parse a workbook whose rows are single CSV-packed cells
+
+    Prices are read as ``price_dtype`` (float32 is ample and halves the
+    memory every pass streams through). Volume is cast to ``volume_dtype``
+    when given; an integer dtype is only applied if the column has no blank
+    cells and fits, since NaN has no int form. The frame is indexed by Date
+    in ascending order.
+    """
+    from openpyxl import load_workbook
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        # Row 1 is the header
+        lines = [value for (value,) in
+                 wb.active.iter_rows(min_row=2, max_col=1, values_only=True) if value]
+    finally:
+        wb.close()
+    
+    # Sniff the date format from the first row so dates parse on the fast
+    # fixed-format path instead of being inferred element by element
+    date_format = guess_datetime_format(lines[0].split(',', 1)[0]) if lines else None
+    
+    # Hand the rows to a native CSV parser in one go
+    df = pd.read_csv(
+        io.BytesIO('\n'.join(lines).encode()),
+        names=['Date'] + PRICE_COLUMNS + ['Volume'],
+        parse_dates=['Date'],
+        date_format=date_format,
+        dtype={col: price_dtype for col in PRICE_COLUMNS},
+        engine=CSV_ENGINE
+    )
+    if volume_dtype is not None:
+        volume = df['Volume']
+        if np.issubdtype(volume_dtype, np.floating):
+            df['Volume'] = volume.astype(volume_dtype)
+        elif volume.notna().all() and volume.max() <= np.iinfo(volume_dtype).max:
+            df['Volume'] = volume.astype(volume_dtype)
+    
+    df = df.set_index('Date')
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
+
+# Indicator kernels
+@njit(cache=True)
+def _sma_kernel(a, window):
+    """Rolling mean from a running sum: one add and one subtract per step"""
+    n = a.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    nans = 0
+    for i in range(n):
+        x = a[i]
+        if x == x:
+            total += x
+        else:
+            nans += 1
+        if i >= window:
+            x = a[i - window]
+            if x == x:
+                total -= x
+            else:
+                nans -= 1
+        # Like rolling().mean(), a window with any NaN has no value
+        if i >= window - 1 and nans == 0:
+            out[i] = total / window
+    return out
+
+def sma(a, window):
+    """Simple moving average of a price array (NaN until the window fills)"""
+    return _sma_kernel(np.ascontiguousarray(a, dtype=np.float64), window)
+
+@njit(cache=True)
+def _rsi_kernel(close, window):
+    """Single-pass RSI: running gain/loss sums over the trailing window"""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, n):
+        d = close[i] - close[i-1]
+        if d > 0:
+            gain_sum += d
+        elif d < 0:
+            loss_sum -= d
+        j = i - window
+        if j >= 1:
+            d = close[j] - close[j-1]
+            if d > 0:
+                gain_sum -= d
+            elif d < 0:
+                loss_sum += d
+        if i >= window - 1:
+            if loss_sum > 0:
+                out[i] = 100 - 100 / (1 + gain_sum / loss_sum)
+            elif gain_sum > 0:
+                out[i] = 100.0
+    return out
+
+def calculate_rsi(close, window=14):
+    """Relative Strength Index of a price array"""
+    return _rsi_kernel(np.ascontiguousarray(close, dtype=np.float64), window)
+
+@njit(cache=True)
+def cumulative_return(returns):
+    """Growth of 1 unit, compounding in one pass
+
+    Like Series.cumprod, a NaN return stays NaN and is skipped by the product.
+    """
+    out = np.empty_like(returns)
+    acc = 1.0
+    for i in range(returns.shape[0]):
+        r = returns[i]
+        if r == r:
+            acc *= 1.0 + r
+            out[i] = acc
+        else:
+            out[i] = np.nan
+    return out
+
+def quantile(a, q):
+    """Linear-interpolated quantile via partial selection (matches np.percentile)"""
+    pos = q * (len(a) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(a) - 1)
+    part = np.partition(a, [lo, hi])
+    return part[lo] + (pos - lo) * (part[hi] - part[lo])
@@ -0,0 +1,29 @@
+"""
+Shared helpers for the Flask apps
+"""
+
+import json
+from functools import lru_cache
+
+from flask import Response, render_template
+
+# Serialize API payloads with orjson when it is installed
+try:
+    import orjson
+    dumps_json = orjson.dumps
+except ImportError:
+    def dumps_json(payload):
+        return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+def ojson(payload, status=200):
+    """JSON response that bypasses jsonify's stdlib encoder"""
+    return Response(dumps_json(payload), status=status, mimetype='application/json')
+
+# Render each static page on its first request only, and let browsers and the
+# edge cache them; a broken template then fails its own route, not the import
+STATIC_PAGE_HEADERS = {'Cache-Control': 'public, max-age=3600'}
+
+@lru_cache(maxsize=None)
+def static_page(name):
+    """Render a template that takes no context once and keep the HTML"""
+    return render_template(name)